@@ -6,8 +6,11 @@ any real LLM or local model.
 
 Usage:
     python test_local_integration.py
+    python test_local_integration.py --dates 2024-05-10 2024-05-13 2024-05-14
 """
 
+import argparse
+import asyncio
 import sys
 import os
 
@@ -17,42 +20,8 @@ from tradingagents.graph.trading_graph import TradingAgentsGraph
 from tradingagents.default_config import DEFAULT_CONFIG
 
 
-def run_test():
-    config = DEFAULT_CONFIG.copy()
-    config["llm_provider"] = "mock"
-    config["deep_think_llm"] = "mock-deep"
-    config["quick_think_llm"] = "mock-quick"
-    config["max_debate_rounds"] = 1
-    config["max_risk_discuss_rounds"] = 1
-
-    print("=" * 60)
-    print("Integration Test: Full Pipeline with Mock LLM")
-    print("=" * 60)
-    print()
-
-    selected_analysts = ["market", "social", "news", "fundamentals"]
-    print(f"Analysts: {', '.join(selected_analysts)}")
-    print(f"Provider: {config['llm_provider']}")
-    print(f"Ticker: NVDA | Date: 2024-05-10")
-    print()
-
-    print("[1/3] Initializing TradingAgentsGraph...")
-    ta = TradingAgentsGraph(
-        selected_analysts=selected_analysts,
-        debug=True,
-        config=config,
-    )
-    print("      Graph initialized successfully.")
-    print()
-
-    print("[2/3] Running propagate('NVDA', '2024-05-10')...")
-    print("-" * 60)
-    final_state, decision = ta.propagate("NVDA", "2024-05-10")
-    print("-" * 60)
-    print("      Pipeline completed.")
-    print()
-
-    print("[3/3] Validating results...")
+def validate_result(final_state, decision):
+    """Check one propagation result and return the list of errors found."""
     errors = []
 
     # Validate reports
@@ -135,6 +104,84 @@ def run_test():
         errors.append(f"Signal extraction returned unexpected: '{decision}'")
         print(f"  [FAIL] Signal Extraction: got '{decision}', expected BUY/SELL/HOLD")
 
+    return errors
+
+
+def run_test(dates=("2024-05-10",)):
+    config = DEFAULT_CONFIG.copy()
+    config["llm_provider"] = "mock"
+    config["deep_think_llm"] = "mock-deep"
+    config["quick_think_llm"] = "mock-quick"
+    config["max_debate_rounds"] = 1
+    config["max_risk_discuss_rounds"] = 1
+
+    parallel_config = dict(config)
+    parallel_config["parallel_analysts"] = True
+    parallel_config["parallel_risk_debate"] = True
+
+    print("=" * 60)
+    print("Integration Test: Full Pipeline with Mock LLM")
+    print("=" * 60)
+    print()
+
+    selected_analysts = ["market", "social", "news", "fundamentals"]
+    print(f"Analysts: {', '.join(selected_analysts)}")
+    print(f"Provider: {config['llm_provider']}")
+    ticker = "NVDA"
+    print(f"Ticker: {ticker} | Date(s): {', '.join(dates)}")
+    print()
+
+    print("[1/5] Initializing TradingAgentsGraph (default and parallel)...")
+    ta = TradingAgentsGraph(
+        selected_analysts=selected_analysts,
+        debug=True,
+        config=config,
+    )
+    ta_parallel = TradingAgentsGraph(
+        selected_analysts=selected_analysts,
+        debug=True,
+        config=parallel_config,
+    )
+    print("      Graphs initialized successfully.")
+    print()
+
+    print(f"[2/5] Running propagate('{ticker}', '{dates[0]}') on the default graph...")
+    print("-" * 60)
+    sequential_result = ta.propagate(ticker, dates[0])
+    print("-" * 60)
+    print("      Pipeline completed.")
+    print()
+
+    print(f"[3/5] Running apropagate('{ticker}', '{dates[0]}') on the parallel graph...")
+    print("-" * 60)
+    async_result = asyncio.run(ta_parallel.apropagate(ticker, dates[0]))
+    print("-" * 60)
+    print("      Pipeline completed.")
+    print()
+
+    print(f"[4/5] Running apropagate_batch for {len(dates)} date(s) on the parallel graph...")
+    print("-" * 60)
+    batch_results = asyncio.run(
+        ta_parallel.apropagate_batch([(ticker, trade_date) for trade_date in dates])
+    )
+    print("-" * 60)
+    print("      Pipeline completed.")
+    print()
+
+    runs = [
+        (f"propagate {dates[0]}", sequential_result),
+        (f"apropagate {dates[0]}", async_result),
+    ] + [
+        (f"apropagate_batch {trade_date}", result)
+        for trade_date, result in zip(dates, batch_results)
+    ]
+
+    print("[5/5] Validating results...")
+    errors = []
+    for label, (final_state, decision) in runs:
+        print(f"  {ticker} {label}:")
+        errors.extend(validate_result(final_state, decision))
+
     print()
     print("=" * 60)
     if errors:
@@ -145,10 +192,20 @@ def run_test():
         return 1
     else:
         print("PASSED: All checks passed")
-        print(f"  Decision: {decision_upper}")
+        for label, (_, decision) in runs:
+            print(f"  Decision ({label}): {decision.strip().upper()}")
         print("=" * 60)
         return 0
 
 
 if __name__ == "__main__":
-    sys.exit(run_test())
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--dates",
+        nargs="+",
+        default=["2024-05-10"],
+        help="Trade date(s) for the concurrent batch run (YYYY-MM-DD); "
+        "the first one is also run through propagate() and apropagate()",
+    )
+    args = parser.parse_args()
+    sys.exit(run_test(args.dates))
@@ -1,12 +1,13 @@
 import time
 import json
 
+from langchain_core.runnables import RunnableLambda
+
 
 def create_aggressive_debator(llm):
-    def aggressive_node(state) -> dict:
+    def build_prompt(state) -> str:
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
-        aggressive_history = risk_debate_state.get("aggressive_history", "")
 
         current_conservative_response = risk_debate_state.get("current_conservative_response", "")
         current_neutral_response = risk_debate_state.get("current_neutral_response", "")
@@ -32,7 +33,12 @@ Here is the current conversation history: {history} Here are the last arguments
 
 Engage actively by addressing any specific concerns raised, refuting the weaknesses in their logic, and asserting the benefits of risk-taking to outpace market norms. Maintain a focus on debating and persuading, not just presenting data. Challenge each counterpoint to underscore why a high-risk approach is optimal. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        return prompt
+
+    def update_debate_state(state, response) -> dict:
+        risk_debate_state = state["risk_debate_state"]
+        history = risk_debate_state.get("history", "")
+        aggressive_history = risk_debate_state.get("aggressive_history", "")
 
         argument = f"Aggressive Analyst: {response.content}"
 
@@ -52,4 +58,10 @@ Engage actively by addressing any specific concerns raised, refuting the weaknes
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return aggressive_node
+    def aggressive_node(state) -> dict:
+        return update_debate_state(state, llm.invoke(build_prompt(state)))
+
+    async def aaggressive_node(state) -> dict:
+        return update_debate_state(state, await llm.ainvoke(build_prompt(state)))
+
+    return RunnableLambda(aggressive_node, afunc=aaggressive_node)
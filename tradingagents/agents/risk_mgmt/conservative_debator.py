@@ -1,13 +1,14 @@
-from langchain_core.messages import AIMessage
 import time
 import json
 
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
 
 def create_conservative_debator(llm):
-    def conservative_node(state) -> dict:
+    def build_prompt(state) -> str:
         risk_debate_state = state["risk_debate_state"]
         history = risk_debate_state.get("history", "")
-        conservative_history = risk_debate_state.get("conservative_history", "")
 
         current_aggressive_response = risk_debate_state.get("current_aggressive_response", "")
         current_neutral_response = risk_debate_state.get("current_neutral_response", "")
@@ -33,7 +34,12 @@ Here is the current conversation history: {history} Here is the last response fr
 
 Engage by questioning their optimism and emphasizing the potential downsides they may have overlooked. Address each of their counterpoints to showcase why a conservative stance is ultimately the safest path for the firm's assets. Focus on debating and critiquing their arguments to demonstrate the strength of a low-risk strategy over their approaches. Output conversationally as if you are speaking without any special formatting."""
 
-        response = llm.invoke(prompt)
+        return prompt
+
+    def update_debate_state(state, response) -> dict:
+        risk_debate_state = state["risk_debate_state"]
+        history = risk_debate_state.get("history", "")
+        conservative_history = risk_debate_state.get("conservative_history", "")
 
         argument = f"Conservative Analyst: {response.content}"
 
@@ -55,4 +61,10 @@ Engage by questioning their optimism and emphasizing the potential downsides the
 
         return {"risk_debate_state": new_risk_debate_state}
 
-    return conservative_node
+    def conservative_node(state) -> dict:
+        return update_debate_state(state, llm.invoke(build_prompt(state)))
+
+    async def aconservative_node(state) -> dict:
+        return update_debate_state(state, await llm.ainvoke(build_prompt(state)))
+
+    return RunnableLambda(conservative_node, afunc=aconservative_node)
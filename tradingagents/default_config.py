@@ -25,6 +25,14 @@ DEFAULT_CONFIG = {
     "max_debate_rounds": 1,
     "max_risk_discuss_rounds": 1,
     "max_recur_limit": 100,
+    # Run analysts as one concurrent fan-out node (used by apropagate)
+    # Not supported with "llamacpp": its models are not thread-safe
+    "parallel_analysts": False,
+    # Let the three risk analysts speak concurrently within each debate round.
+    # Changes the debate: each analyst only sees the previous round's arguments,
+    # so with max_risk_discuss_rounds=1 they give independent opening statements
+    # Not supported with "llamacpp": its models are not thread-safe
+    "parallel_risk_debate": False,
     # Data vendor configuration
     # Category-level configuration (default for all tools in category)
     "data_vendors": {
@@ -65,3 +65,11 @@ class ConditionalLogic:
         if state["risk_debate_state"]["latest_speaker"].startswith("Conservative"):
             return "Neutral Analyst"
         return "Aggressive Analyst"
+
+    def should_continue_risk_round(self, state: AgentState) -> str:
+        """Determine if another parallel risk debate round should run."""
+        if (
+            state["risk_debate_state"]["count"] >= 3 * self.max_risk_discuss_rounds
+        ):  # each round adds one response from each of the 3 agents
+            return "Risk Judge"
+        return "Risk Analysts"
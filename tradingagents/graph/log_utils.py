@@ -2,23 +2,28 @@
 
 import json
 from pathlib import Path
+from typing import Iterator
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
-def _state_to_md(state: dict) -> list[str]:
-    """Convert a single date's state dict to markdown lines."""
-    parts = []
-    parts.append(
+
+def _state_to_md(state: dict) -> Iterator[str]:
+    """Yield markdown lines for a single date's state dict."""
+    yield (
         f"**Company:** {state.get('company_of_interest', 'N/A')} | **Trade Date:** {state.get('trade_date', 'N/A')}\n"
     )
 
     for key in ["market_report", "sentiment_report", "news_report", "fundamentals_report"]:
         if key in state and state[key]:
             title = key.replace("_", " ").title()
-            parts.append(f"\n---\n## {title}\n\n{state[key]}\n")
+            yield f"\n---\n## {title}\n\n{state[key]}\n"
 
     if "investment_debate_state" in state:
         ids = state["investment_debate_state"]
-        parts.append("\n---\n## Investment Debate\n\n")
+        yield "\n---\n## Investment Debate\n\n"
         for subkey in [
             "bull_history",
             "bear_history",
@@ -28,11 +33,11 @@ def _state_to_md(state: dict) -> list[str]:
         ]:
             if subkey in ids and ids[subkey]:
                 title = subkey.replace("_", " ").title()
-                parts.append(f"### {title}\n\n{ids[subkey]}\n\n")
+                yield f"### {title}\n\n{ids[subkey]}\n\n"
 
     if "risk_debate_state" in state:
         rds = state["risk_debate_state"]
-        parts.append("\n---\n## Risk Debate\n\n")
+        yield "\n---\n## Risk Debate\n\n"
         for subkey in [
             "aggressive_history",
             "conservative_history",
@@ -41,14 +46,22 @@ def _state_to_md(state: dict) -> list[str]:
         ]:
             if subkey in rds and rds[subkey]:
                 title = subkey.replace("_", " ").title()
-                parts.append(f"### {title}\n\n{rds[subkey]}\n\n")
+                yield f"### {title}\n\n{rds[subkey]}\n\n"
 
     for key in ["investment_plan", "final_trade_decision"]:
         if key in state and state[key]:
             title = key.replace("_", " ").title()
-            parts.append(f"\n---\n## {title}\n\n{state[key]}\n")
+            yield f"\n---\n## {title}\n\n{state[key]}\n"
+
 
-    return parts
+def _full_states_to_md(data: dict) -> Iterator[str]:
+    """Yield markdown lines for every date in a full_states_log dict."""
+    for date_key, state in data.items():
+        if not isinstance(state, dict):
+            continue
+        yield f"# Full State Log — {date_key}\n"
+        yield from _state_to_md(state)
+        yield "\n"
 
 
 def full_states_json_to_md(
@@ -68,8 +81,11 @@ def full_states_json_to_md(
     if not json_path.exists():
         raise FileNotFoundError(f"JSON file not found: {json_path}")
 
-    with open(json_path) as f:
-        data = json.load(f)
+    if orjson is not None:
+        data = orjson.loads(json_path.read_bytes())
+    else:
+        with open(json_path) as f:
+            data = json.load(f)
 
     if md_path is None:
         md_path = json_path.with_suffix(".md")
@@ -78,15 +94,14 @@ def full_states_json_to_md(
 
     md_path.parent.mkdir(parents=True, exist_ok=True)
 
-    md_parts = []
-    for date_key, state in data.items():
-        if not isinstance(state, dict):
-            continue
-        md_parts.append(f"# Full State Log — {date_key}\n")
-        md_parts.extend(_state_to_md(state))
-        md_parts.append("\n")
-
-    with open(md_path, "w") as f:
-        f.write("\n".join(md_parts))
+    # Stream lines straight to disk, newline-separated, without building the
+    # whole document in memory first. Binary mode with a large buffer skips
+    # newline translation and keeps the number of write syscalls low.
+    with open(md_path, "wb", buffering=1 << 20) as f:
+        sep = b""
+        for line in _full_states_to_md(data):
+            f.write(sep)
+            f.write(line.encode("utf-8"))
+            sep = b"\n"
 
     return md_path
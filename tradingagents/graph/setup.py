@@ -1,6 +1,8 @@
 # TradingAgents/graph/setup.py
 
+import asyncio
 from typing import Dict, Any
+from langchain_core.runnables import RunnableLambda
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph, START
 from langgraph.prebuilt import ToolNode
@@ -11,6 +13,15 @@ from tradingagents.agents.utils.agent_states import AgentState
 from .conditional_logic import ConditionalLogic
 
 
+# State field each analyst writes its final report to
+ANALYST_REPORT_FIELDS = {
+    "market": "market_report",
+    "social": "sentiment_report",
+    "news": "news_report",
+    "fundamentals": "fundamentals_report",
+}
+
+
 class GraphSetup:
     """Handles the setup and configuration of the agent graph."""
 
@@ -37,8 +48,106 @@ class GraphSetup:
         self.risk_manager_memory = risk_manager_memory
         self.conditional_logic = conditional_logic
 
+    def _create_analyst_subgraph(self, analyst_type, analyst_node, tool_node):
+        """Compile a standalone analyst -> tools loop that ends once the report is written."""
+        analyst_name = f"{analyst_type.capitalize()} Analyst"
+        tools_name = f"tools_{analyst_type}"
+
+        subgraph = StateGraph(AgentState)
+        subgraph.add_node(analyst_name, analyst_node)
+        subgraph.add_node(tools_name, tool_node)
+        subgraph.add_edge(START, analyst_name)
+        subgraph.add_conditional_edges(
+            analyst_name,
+            getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+            {
+                tools_name: tools_name,
+                f"Msg Clear {analyst_type.capitalize()}": END,
+            },
+        )
+        subgraph.add_edge(tools_name, analyst_name)
+        return subgraph.compile()
+
+    def _create_analyst_team_node(self, analyst_subgraphs):
+        """Create a scatter node that runs all analyst subgraphs on the same input state.
+
+        The analysts are independent of each other, so the async path dispatches
+        them concurrently with asyncio.gather. Each subgraph works on its own
+        message history; only the reports are merged back, followed by the same
+        message cleanup the sequential graph performs after each analyst.
+        """
+        msg_delete = create_msg_delete()
+
+        def merge(state, results):
+            update = {
+                ANALYST_REPORT_FIELDS[analyst_type]: result[ANALYST_REPORT_FIELDS[analyst_type]]
+                for analyst_type, result in zip(analyst_subgraphs, results)
+            }
+            update.update(msg_delete(state))
+            return update
+
+        def analyst_team_node(state, config):
+            results = [
+                subgraph.invoke(state, config)
+                for subgraph in analyst_subgraphs.values()
+            ]
+            return merge(state, results)
+
+        async def aanalyst_team_node(state, config):
+            results = await asyncio.gather(
+                *(subgraph.ainvoke(state, config) for subgraph in analyst_subgraphs.values())
+            )
+            return merge(state, results)
+
+        return RunnableLambda(analyst_team_node, afunc=aanalyst_team_node)
+
+    def _create_risk_team_node(self, aggressive_node, conservative_node, neutral_node):
+        """Create a node that runs one round of the risk debate with all three analysts at once.
+
+        Unlike the turn-taking debate, an analyst never sees what the others
+        say in the same round: each one only responds to the previous round's
+        arguments, so in the first round all three give independent opening
+        statements. The async path awaits the debaters' native async variants
+        (llm.ainvoke) with asyncio.gather on the event loop. Rounds themselves
+        stay sequential.
+        """
+        speakers = (
+            ("aggressive", aggressive_node),
+            ("conservative", conservative_node),
+            ("neutral", neutral_node),
+        )
+
+        def merge(state, results):
+            risk_debate_state = state["risk_debate_state"]
+            new_risk_debate_state = dict(risk_debate_state)
+            history = risk_debate_state.get("history", "")
+            for (role, _), result in zip(speakers, results):
+                role_state = result["risk_debate_state"]
+                argument = role_state[f"current_{role}_response"]
+                history = history + "\n" + argument
+                new_risk_debate_state[f"{role}_history"] = role_state[f"{role}_history"]
+                new_risk_debate_state[f"current_{role}_response"] = argument
+            new_risk_debate_state["history"] = history
+            new_risk_debate_state["latest_speaker"] = "Neutral"
+            new_risk_debate_state["count"] = risk_debate_state["count"] + len(speakers)
+            return {"risk_debate_state": new_risk_debate_state}
+
+        def risk_team_node(state, config):
+            return merge(state, [node.invoke(state, config) for _, node in speakers])
+
+        async def arisk_team_node(state, config):
+            results = await asyncio.gather(
+                *(node.ainvoke(state, config) for _, node in speakers)
+            )
+            return merge(state, results)
+
+        return RunnableLambda(risk_team_node, afunc=arisk_team_node)
+
     def setup_graph(
-        self, selected_analysts=["market", "social", "news", "fundamentals"]
+        self,
+        selected_analysts=["market", "social", "news", "fundamentals"],
+        parallel_analysts=False,
+        parallel_risk_debate=False,
     ):
         """Set up and compile the agent workflow graph.
 
@@ -48,6 +157,16 @@ class GraphSetup:
                 - "social": Social media analyst
                 - "news": News analyst
                 - "fundamentals": Fundamentals analyst
+            parallel_analysts (bool): Run the selected analysts in a single
+                "Analyst Team" node, concurrently when the graph is invoked
+                asynchronously, instead of chaining them one after another.
+            parallel_risk_debate (bool): Let the aggressive, conservative and
+                neutral analysts speak simultaneously in each risk debate round
+                instead of taking turns. This changes the debate: each analyst
+                only responds to the previous round's arguments, never to what
+                the others say in the same round, so with
+                ``max_risk_discuss_rounds=1`` the three give independent opening
+                statements rather than a rebuttal chain.
         """
         if len(selected_analysts) == 0:
             raise ValueError("Trading Agents Graph Setup Error: no analysts selected!")
@@ -109,48 +228,72 @@ class GraphSetup:
         workflow = StateGraph(AgentState)
 
         # Add analyst nodes to the graph
-        for analyst_type, node in analyst_nodes.items():
-            workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
+        if parallel_analysts:
+            analyst_subgraphs = {
+                analyst_type: self._create_analyst_subgraph(
+                    analyst_type, node, tool_nodes[analyst_type]
+                )
+                for analyst_type, node in analyst_nodes.items()
+            }
             workflow.add_node(
-                f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
+                "Analyst Team", self._create_analyst_team_node(analyst_subgraphs)
             )
-            workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
+        else:
+            for analyst_type, node in analyst_nodes.items():
+                workflow.add_node(f"{analyst_type.capitalize()} Analyst", node)
+                workflow.add_node(
+                    f"Msg Clear {analyst_type.capitalize()}", delete_nodes[analyst_type]
+                )
+                workflow.add_node(f"tools_{analyst_type}", tool_nodes[analyst_type])
 
         # Add other nodes
         workflow.add_node("Bull Researcher", bull_researcher_node)
         workflow.add_node("Bear Researcher", bear_researcher_node)
         workflow.add_node("Research Manager", research_manager_node)
         workflow.add_node("Trader", trader_node)
-        workflow.add_node("Aggressive Analyst", aggressive_analyst)
-        workflow.add_node("Neutral Analyst", neutral_analyst)
-        workflow.add_node("Conservative Analyst", conservative_analyst)
+        if parallel_risk_debate:
+            workflow.add_node(
+                "Risk Analysts",
+                self._create_risk_team_node(
+                    aggressive_analyst, conservative_analyst, neutral_analyst
+                ),
+            )
+        else:
+            workflow.add_node("Aggressive Analyst", aggressive_analyst)
+            workflow.add_node("Neutral Analyst", neutral_analyst)
+            workflow.add_node("Conservative Analyst", conservative_analyst)
         workflow.add_node("Risk Judge", risk_manager_node)
 
         # Define edges
-        # Start with the first analyst
-        first_analyst = selected_analysts[0]
-        workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
+        if parallel_analysts:
+            # Fan out to all analysts at once, then hand over to the researchers
+            workflow.add_edge(START, "Analyst Team")
+            workflow.add_edge("Analyst Team", "Bull Researcher")
+        else:
+            # Start with the first analyst
+            first_analyst = selected_analysts[0]
+            workflow.add_edge(START, f"{first_analyst.capitalize()} Analyst")
 
-        # Connect analysts in sequence
-        for i, analyst_type in enumerate(selected_analysts):
-            current_analyst = f"{analyst_type.capitalize()} Analyst"
-            current_tools = f"tools_{analyst_type}"
-            current_clear = f"Msg Clear {analyst_type.capitalize()}"
+            # Connect analysts in sequence
+            for i, analyst_type in enumerate(selected_analysts):
+                current_analyst = f"{analyst_type.capitalize()} Analyst"
+                current_tools = f"tools_{analyst_type}"
+                current_clear = f"Msg Clear {analyst_type.capitalize()}"
 
-            # Add conditional edges for current analyst
-            workflow.add_conditional_edges(
-                current_analyst,
-                getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
-                [current_tools, current_clear],
-            )
-            workflow.add_edge(current_tools, current_analyst)
+                # Add conditional edges for current analyst
+                workflow.add_conditional_edges(
+                    current_analyst,
+                    getattr(self.conditional_logic, f"should_continue_{analyst_type}"),
+                    [current_tools, current_clear],
+                )
+                workflow.add_edge(current_tools, current_analyst)
 
-            # Connect to next analyst or to Bull Researcher if this is the last analyst
-            if i < len(selected_analysts) - 1:
-                next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
-                workflow.add_edge(current_clear, next_analyst)
-            else:
-                workflow.add_edge(current_clear, "Bull Researcher")
+                # Connect to next analyst or to Bull Researcher if this is the last analyst
+                if i < len(selected_analysts) - 1:
+                    next_analyst = f"{selected_analysts[i+1].capitalize()} Analyst"
+                    workflow.add_edge(current_clear, next_analyst)
+                else:
+                    workflow.add_edge(current_clear, "Bull Researcher")
 
         # Add remaining edges
         workflow.add_conditional_edges(
@@ -170,31 +313,42 @@ class GraphSetup:
             },
         )
         workflow.add_edge("Research Manager", "Trader")
-        workflow.add_edge("Trader", "Aggressive Analyst")
-        workflow.add_conditional_edges(
-            "Aggressive Analyst",
-            self.conditional_logic.should_continue_risk_analysis,
-            {
-                "Conservative Analyst": "Conservative Analyst",
-                "Risk Judge": "Risk Judge",
-            },
-        )
-        workflow.add_conditional_edges(
-            "Conservative Analyst",
-            self.conditional_logic.should_continue_risk_analysis,
-            {
-                "Neutral Analyst": "Neutral Analyst",
-                "Risk Judge": "Risk Judge",
-            },
-        )
-        workflow.add_conditional_edges(
-            "Neutral Analyst",
-            self.conditional_logic.should_continue_risk_analysis,
-            {
-                "Aggressive Analyst": "Aggressive Analyst",
-                "Risk Judge": "Risk Judge",
-            },
-        )
+        if parallel_risk_debate:
+            workflow.add_edge("Trader", "Risk Analysts")
+            workflow.add_conditional_edges(
+                "Risk Analysts",
+                self.conditional_logic.should_continue_risk_round,
+                {
+                    "Risk Analysts": "Risk Analysts",
+                    "Risk Judge": "Risk Judge",
+                },
+            )
+        else:
+            workflow.add_edge("Trader", "Aggressive Analyst")
+            workflow.add_conditional_edges(
+                "Aggressive Analyst",
+                self.conditional_logic.should_continue_risk_analysis,
+                {
+                    "Conservative Analyst": "Conservative Analyst",
+                    "Risk Judge": "Risk Judge",
+                },
+            )
+            workflow.add_conditional_edges(
+                "Conservative Analyst",
+                self.conditional_logic.should_continue_risk_analysis,
+                {
+                    "Neutral Analyst": "Neutral Analyst",
+                    "Risk Judge": "Risk Judge",
+                },
+            )
+            workflow.add_conditional_edges(
+                "Neutral Analyst",
+                self.conditional_logic.should_continue_risk_analysis,
+                {
+                    "Aggressive Analyst": "Aggressive Analyst",
+                    "Risk Judge": "Risk Judge",
+                },
+            )
 
         workflow.add_edge("Risk Judge", END)
 
@@ -1,6 +1,8 @@
 # TradingAgents/graph/trading_graph.py
 
+import asyncio
 import os
+import threading
 from pathlib import Path
 import json
 from datetime import date
@@ -62,6 +64,15 @@ class TradingAgentsGraph:
         self.config = config or DEFAULT_CONFIG
         self.callbacks = callbacks or []
 
+        # llama.cpp models are shared between clients and not thread-safe
+        if self._is_llamacpp():
+            for option in ("parallel_analysts", "parallel_risk_debate"):
+                if self.config.get(option):
+                    raise ValueError(
+                        f"{option} is not supported with the llamacpp provider: "
+                        "llama.cpp models cannot be called from several threads at once"
+                    )
+
         # Update the interface's config
         set_config(self.config)
 
@@ -80,7 +91,7 @@ class TradingAgentsGraph:
 
         deep_kwargs = dict(llm_kwargs)
         quick_kwargs = dict(llm_kwargs)
-        if self.config.get("llm_provider", "").lower() == "llamacpp":
+        if self._is_llamacpp():
             deep_kwargs["model_path"] = self.config.get("local_model_path_deep")
             quick_kwargs["model_path"] = self.config.get("local_model_path_quick")
 
@@ -132,9 +143,18 @@ class TradingAgentsGraph:
         self.curr_state = None
         self.ticker = None
         self.log_states_dict = {}  # date to full state dict
+        # Async runs log from worker threads; serialize access to the dict/files
+        self._log_lock = threading.Lock()
 
         # Set up the graph
-        self.graph = self.graph_setup.setup_graph(selected_analysts)
+        self.graph = self.graph_setup.setup_graph(
+            selected_analysts,
+            parallel_analysts=self.config.get("parallel_analysts", False),
+            parallel_risk_debate=self.config.get("parallel_risk_debate", False),
+        )
+
+    def _is_llamacpp(self) -> bool:
+        return self.config.get("llm_provider", "").lower() == "llamacpp"
 
     def _get_provider_kwargs(self) -> Dict[str, Any]:
         """Get provider-specific kwargs for LLM client creation."""
@@ -198,22 +218,13 @@ class TradingAgentsGraph:
         """Run the trading agents graph for a company on a specific date."""
 
         self.ticker = company_name
-
-        # Initialize state
-        init_agent_state = self.propagator.create_initial_state(
-            company_name, trade_date
-        )
-        args = self.propagator.get_graph_args()
+        init_agent_state, args = self._create_run_inputs(company_name, trade_date)
 
         if self.debug:
             # Debug mode with tracing
             trace = []
             for chunk in self.graph.stream(init_agent_state, **args):
-                if len(chunk["messages"]) == 0:
-                    pass
-                else:
-                    chunk["messages"][-1].pretty_print()
-                    trace.append(chunk)
+                self._trace_chunk(chunk, trace)
 
             final_state = trace[-1]
         else:
@@ -223,14 +234,130 @@ class TradingAgentsGraph:
         # Store current state for reflection
         self.curr_state = final_state
 
-        # Log state
-        self._log_state(trade_date, final_state)
+        return self._complete_run(trade_date, final_state)
+
+    async def apropagate(self, company_name, trade_date):
+        """Asynchronously run the trading agents graph for a company on a specific date.
+
+        With ``parallel_analysts`` / ``parallel_risk_debate`` enabled in the
+        config, the analysts and the risk debaters of each round are
+        dispatched concurrently instead of one after another.
+        """
+
+        self.ticker = company_name
+        final_state = await self._arun_graph(company_name, trade_date)
+
+        # Store current state for reflection
+        self.curr_state = final_state
+
+        return await self._acomplete_run(trade_date, final_state)
+
+    def _create_run_inputs(self, company_name, trade_date):
+        """Build the initial state and invocation args for one graph run."""
+        init_agent_state = self.propagator.create_initial_state(
+            company_name, trade_date
+        )
+        return init_agent_state, self.propagator.get_graph_args()
+
+    def _trace_chunk(self, chunk, trace):
+        """Print and record a streamed chunk in debug mode."""
+        if len(chunk["messages"]) > 0:
+            chunk["messages"][-1].pretty_print()
+            trace.append(chunk)
 
-        # Return decision and processed signal
+    async def _arun_graph(self, company_name, trade_date):
+        """Run the graph asynchronously and return the final state."""
+        init_agent_state, args = self._create_run_inputs(company_name, trade_date)
+
+        if self.debug:
+            # Debug mode with tracing
+            trace = []
+            async for chunk in self.graph.astream(init_agent_state, **args):
+                self._trace_chunk(chunk, trace)
+
+            return trace[-1]
+
+        # Standard mode without tracing
+        return await self.graph.ainvoke(init_agent_state, **args)
+
+    def _complete_run(self, trade_date, final_state):
+        """Log the final state and return it with the processed signal."""
+        self._log_state(trade_date, final_state)
         return final_state, self.process_signal(final_state["final_trade_decision"])
 
+    async def _acomplete_run(self, trade_date, final_state):
+        """Async variant of _complete_run that keeps the event loop free.
+
+        Logging does blocking file I/O, so it runs in a worker thread, and the
+        signal is extracted with the LLM's native async call.
+        """
+        await asyncio.to_thread(self._log_state, trade_date, final_state)
+        decision = await self.signal_processor.aprocess_signal(
+            final_state["final_trade_decision"]
+        )
+        return final_state, decision
+
+    async def apropagate_batch(self, pairs, concurrency=8):
+        """Run the graph for several (company_name, trade_date) pairs concurrently.
+
+        All runs share this instance's LLMs, memories and tool nodes, and
+        LangGraph executes sync nodes in worker threads, so the configured LLM
+        clients must tolerate concurrent calls. Batch runs do not update
+        ``curr_state``, so ``reflect_and_remember`` is not supported after a
+        batch; use ``propagate``/``apropagate`` for runs you want to reflect on.
+        Pairs with the same ticker also race on the shared yfinance CSV cache
+        in ``dataflows/stockstats_utils.py`` (keyed on symbol and today's date),
+        so avoid repeating a ticker that is not cached yet.
+
+        If any run fails, the runs still pending are cancelled and the first
+        error is raised; sync nodes already executing in worker threads finish
+        their current step before the cancellation takes effect.
+
+        Args:
+            pairs: Iterable of (company_name, trade_date) tuples
+            concurrency: Maximum number of graph runs in flight at once
+
+        Returns:
+            List of (final_state, decision) tuples in the same order as pairs
+
+        Raises:
+            ValueError: If concurrency is less than 1, or greater than 1 with
+                the llamacpp provider, whose models are not thread-safe
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        if concurrency > 1 and self._is_llamacpp():
+            raise ValueError(
+                "apropagate_batch with concurrency > 1 is not supported with the "
+                "llamacpp provider: llama.cpp models cannot be called from several "
+                "threads at once"
+            )
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _run_one(company_name, trade_date):
+            async with semaphore:
+                final_state = await self._arun_graph(company_name, trade_date)
+            return await self._acomplete_run(trade_date, final_state)
+
+        tasks = [
+            asyncio.ensure_future(_run_one(company_name, trade_date))
+            for company_name, trade_date in pairs
+        ]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
     def _log_state(self, trade_date, final_state):
         """Log the final state to a JSON file."""
+        with self._log_lock:
+            self._write_state_log(trade_date, final_state)
+
+    def _write_state_log(self, trade_date, final_state):
         self.log_states_dict[str(trade_date)] = {
             "company_of_interest": final_state["company_of_interest"],
             "trade_date": final_state["trade_date"],
@@ -261,12 +388,14 @@ class TradingAgentsGraph:
             "final_trade_decision": final_state["final_trade_decision"],
         }
 
-        # Save to file
-        directory = Path(f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/")
+        # Save to file (ticker comes from the state, since concurrent runs
+        # may have moved self.ticker on)
+        ticker = final_state["company_of_interest"]
+        directory = Path(f"eval_results/{ticker}/TradingAgentsStrategy_logs/")
         directory.mkdir(parents=True, exist_ok=True)
 
         json_path = Path(
-            f"eval_results/{self.ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json"
+            f"eval_results/{ticker}/TradingAgentsStrategy_logs/full_states_log_{trade_date}.json"
         )
         with open(json_path, "w") as f:
             json.dump(self.log_states_dict, f, indent=4)
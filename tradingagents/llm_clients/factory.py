@@ -4,7 +4,6 @@ from .base_client import BaseLLMClient
 from .openai_client import OpenAIClient
 from .anthropic_client import AnthropicClient
 from .google_client import GoogleClient
-from .mock_client import MockLLMClient
 
 
 def create_llm_client(
@@ -46,6 +45,7 @@ def create_llm_client(
         return LlamaCppClient(model, base_url, **kwargs)
 
     if provider_lower == "mock":
+        from .mock_client import MockLLMClient
         return MockLLMClient(model, base_url, **kwargs)
 
     raise ValueError(f"Unsupported LLM provider: {provider}")
@@ -1,12 +1,19 @@
 """LlamaCpp client for direct local inference from GGUF model files."""
 
 import os
-from typing import Any, Optional
+import weakref
+from typing import Any, Dict, Optional, Tuple
 
 from .base_client import BaseLLMClient
 from .validators import validate_model
 
 
+# Loaded models shared across clients with identical settings (e.g. when the
+# deep and quick configs point at the same GGUF file). Weak references let a
+# model be freed once no client or graph holds it anymore.
+_LLM_REGISTRY: "weakref.WeakValueDictionary[Tuple, Any]" = weakref.WeakValueDictionary()
+
+
 class LlamaCppClient(BaseLLMClient):
     """Client for local inference via llama-cpp-python.
 
@@ -21,6 +28,7 @@ class LlamaCppClient(BaseLLMClient):
     def __init__(self, model: str, base_url: Optional[str] = None, **kwargs):
         super().__init__(model, base_url, **kwargs)
         self._validate_dependencies()
+        self._llm_cache: Dict[Tuple, Any] = {}
 
     @staticmethod
     def _validate_dependencies():
@@ -32,8 +40,23 @@ class LlamaCppClient(BaseLLMClient):
                 "Install with: pip install tradingagents[local]"
             )
 
+    @staticmethod
+    def _cache_key(llm_kwargs: Dict[str, Any]) -> Tuple:
+        return (
+            llm_kwargs["model_path"],
+            llm_kwargs["n_gpu_layers"],
+            llm_kwargs["n_ctx"],
+            llm_kwargs["n_batch"],
+            llm_kwargs.get("temperature"),
+            tuple(id(cb) for cb in llm_kwargs.get("callbacks") or ()),
+        )
+
     def get_llm(self) -> Any:
-        """Return a configured ChatLlamaCpp instance."""
+        """Return a configured ChatLlamaCpp instance.
+
+        Loading a GGUF model is expensive, so instances are reused across calls
+        and across clients that request the same model with the same settings.
+        """
         from langchain_community.chat_models import ChatLlamaCpp
 
         model_path = self.kwargs.get("model_path")
@@ -60,7 +83,15 @@ class LlamaCppClient(BaseLLMClient):
         if "callbacks" in self.kwargs:
             llm_kwargs["callbacks"] = self.kwargs["callbacks"]
 
-        return ChatLlamaCpp(**llm_kwargs)
+        key = self._cache_key(llm_kwargs)
+        llm = self._llm_cache.get(key)
+        if llm is None:
+            llm = _LLM_REGISTRY.get(key)
+            if llm is None:
+                llm = ChatLlamaCpp(**llm_kwargs)
+                _LLM_REGISTRY[key] = llm
+            self._llm_cache[key] = llm
+        return llm
 
     def validate_model(self) -> bool:
         return validate_model("llamacpp", self.model)
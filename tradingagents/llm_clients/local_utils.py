@@ -1,19 +1,29 @@
 """Utilities for local LLM inference: health checks, validation, recommendations."""
 
 import os
+import stat
 import subprocess
-from typing import Dict, List, Optional, Tuple
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
+# Shared session so repeated checks against the local server reuse connections
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
 
-RECOMMENDED_MODELS_32GB: Dict[str, List[Dict[str, str]]] = {
+
+RECOMMENDED_MODELS_32GB: Dict[str, List[Dict[str, Any]]] = {
     "quick_think": [
         {
             "name": "Qwen3-8B-Q4_K_M",
             "ollama": "qwen3:8b",
             "gguf": "Qwen3-8B-Q4_K_M.gguf",
             "size": "~5 GB",
+            "size_gb": 5.0,
             "description": "Fast 8B model, strong tool-calling, ideal for analyst agents",
         },
         {
@@ -21,6 +31,7 @@ RECOMMENDED_MODELS_32GB: Dict[str, List[Dict[str, str]]] = {
             "ollama": "qwen3:4b",
             "gguf": "Qwen3-4B-Q4_K_M.gguf",
             "size": "~3 GB",
+            "size_gb": 3.0,
             "description": "Ultra-light 4B model for budget setups",
         },
     ],
@@ -30,6 +41,7 @@ RECOMMENDED_MODELS_32GB: Dict[str, List[Dict[str, str]]] = {
             "ollama": "qwen3:30b-a3b",
             "gguf": "Qwen3-30B-A3B-Q4_K_M.gguf",
             "size": "~18 GB",
+            "size_gb": 18.0,
             "description": "MoE 30B model (only 3B active), excellent reasoning at low memory cost",
         },
         {
@@ -37,12 +49,40 @@ RECOMMENDED_MODELS_32GB: Dict[str, List[Dict[str, str]]] = {
             "ollama": "qwen3:14b",
             "gguf": "Qwen3-14B-Q4_K_M.gguf",
             "size": "~9 GB",
+            "size_gb": 9.0,
             "description": "Dense 14B model, strong reasoning for mid-range setups",
         },
     ],
 }
 
 
+# Parsed /api/tags responses per base URL, reused for a few seconds so that
+# back-to-back checks (health, quick model, deep model) share one request.
+_TAGS_TTL_SECONDS = 5.0
+_TAGS_CACHE: Dict[str, Tuple[float, List[Dict]]] = {}
+
+
+def _get_ollama_models(base_url: str) -> List[Dict]:
+    """Return the model list from Ollama's /api/tags, cached for a short TTL.
+
+    Raises:
+        requests.HTTPError: If Ollama responds with a non-200 status.
+        requests.RequestException: On connection errors or timeouts.
+    """
+    cached = _TAGS_CACHE.get(base_url)
+    if cached is not None and time.monotonic() - cached[0] < _TAGS_TTL_SECONDS:
+        return cached[1]
+
+    resp = _SESSION.get(f"{base_url}/api/tags", timeout=5)
+    if resp.status_code != 200:
+        raise requests.HTTPError(
+            f"Ollama returned status {resp.status_code}", response=resp
+        )
+    models = resp.json().get("models", [])
+    _TAGS_CACHE[base_url] = (time.monotonic(), models)
+    return models
+
+
 def check_ollama_health(base_url: str = "http://localhost:11434") -> Tuple[bool, str]:
     """Check if Ollama server is running and responsive.
 
@@ -50,12 +90,13 @@ def check_ollama_health(base_url: str = "http://localhost:11434") -> Tuple[bool,
         (is_healthy, message)
     """
     try:
-        resp = requests.get(f"{base_url}/api/tags", timeout=5)
-        if resp.status_code == 200:
-            models = resp.json().get("models", [])
-            model_names = [m["name"] for m in models]
-            return True, f"Ollama running with {len(models)} model(s): {', '.join(model_names) or 'none'}"
-        return False, f"Ollama returned status {resp.status_code}"
+        models = _get_ollama_models(base_url)
+        if not models:
+            return True, "Ollama running with 0 model(s): none"
+        model_names = ", ".join(m["name"] for m in models)
+        return True, f"Ollama running with {len(models)} model(s): {model_names}"
+    except requests.HTTPError as e:
+        return False, str(e)
     except requests.ConnectionError:
         return False, "Ollama server not reachable. Start with: ollama serve"
     except requests.Timeout:
@@ -67,11 +108,8 @@ def check_ollama_health(base_url: str = "http://localhost:11434") -> Tuple[bool,
 def check_ollama_model(model_name: str, base_url: str = "http://localhost:11434") -> bool:
     """Check if a specific model is available in Ollama."""
     try:
-        resp = requests.get(f"{base_url}/api/tags", timeout=5)
-        if resp.status_code == 200:
-            models = resp.json().get("models", [])
-            available = [m["name"] for m in models]
-            return any(model_name in name for name in available)
+        available = [m["name"] for m in _get_ollama_models(base_url)]
+        return any(model_name in name for name in available)
     except Exception:
         pass
     return False
@@ -84,15 +122,38 @@ def pull_ollama_model(model_name: str) -> Tuple[bool, str]:
         (success, message)
     """
     try:
-        result = subprocess.run(
+        # Stream the progress output instead of buffering it: pulls of large
+        # models print a lot of it. Only the tail is kept for error messages.
+        proc = subprocess.Popen(
             ["ollama", "pull", model_name],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            timeout=600,
+            # Never let a stray byte kill the reader thread and stall the pipe
+            encoding="utf-8",
+            errors="replace",
         )
-        if result.returncode == 0:
+        tail = deque(maxlen=20)
+        reader = threading.Thread(
+            target=lambda: tail.extend(line.rstrip() for line in proc.stdout),
+            daemon=True,
+        )
+        reader.start()
+        try:
+            proc.wait(timeout=600)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        finally:
+            reader.join(timeout=5)
+            proc.stdout.close()
+
+        if proc.returncode == 0:
+            # The cached tag lists predate this model
+            _TAGS_CACHE.clear()
             return True, f"Successfully pulled {model_name}"
-        return False, f"Failed to pull {model_name}: {result.stderr}"
+        return False, f"Failed to pull {model_name}: " + "\n".join(tail)
     except FileNotFoundError:
         return False, "ollama CLI not found. Install from: https://ollama.com"
     except subprocess.TimeoutExpired:
@@ -101,6 +162,18 @@ def pull_ollama_model(model_name: str) -> Tuple[bool, str]:
         return False, f"Error pulling model: {e}"
 
 
+def _stat_regular_file(path: str) -> Optional[os.stat_result]:
+    """Return the stat result for path if it is a regular file, else None.
+
+    One stat() call replaces the separate isfile/getsize lookups.
+    """
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
+
 def validate_gguf_path(path: str) -> Tuple[bool, str]:
     """Validate that a GGUF model file exists and is readable.
 
@@ -109,15 +182,15 @@ def validate_gguf_path(path: str) -> Tuple[bool, str]:
     """
     if not path:
         return False, "No model path provided"
-    if not os.path.isfile(path):
+    st = _stat_regular_file(path)
+    if st is None:
         return False, f"File not found: {path}"
     if not path.lower().endswith(".gguf"):
         return False, f"File does not have .gguf extension: {path}"
     if not os.access(path, os.R_OK):
         return False, f"File not readable: {path}"
 
-    size_bytes = os.path.getsize(path)
-    size_gb = size_bytes / (1024 ** 3)
+    size_gb = st.st_size / (1024 ** 3)
     return True, f"Valid GGUF file ({size_gb:.1f} GB)"
 
 
@@ -126,10 +199,10 @@ def estimate_memory_usage(model_path: str) -> Optional[float]:
 
     Rule of thumb: runtime memory ~ 1.1-1.2x file size for inference.
     """
-    if not os.path.isfile(model_path):
+    st = _stat_regular_file(model_path)
+    if st is None:
         return None
-    size_bytes = os.path.getsize(model_path)
-    return round(size_bytes * 1.15 / (1024 ** 3), 1)
+    return round(st.st_size * 1.15 / (1024 ** 3), 1)
 
 
 def get_model_recommendations(available_ram_gb: float = 32.0) -> Dict[str, List[Dict]]:
@@ -137,19 +210,11 @@ def get_model_recommendations(available_ram_gb: float = 32.0) -> Dict[str, List[
 
     Returns filtered recommendations from RECOMMENDED_MODELS_32GB.
     """
-    SIZE_MAP = {
-        "~3 GB": 3.0,
-        "~5 GB": 5.0,
-        "~9 GB": 9.0,
-        "~18 GB": 18.0,
-    }
-
     result = {"quick_think": [], "deep_think": []}
 
     for tier in ("quick_think", "deep_think"):
         for model in RECOMMENDED_MODELS_32GB[tier]:
-            size = SIZE_MAP.get(model["size"], 99.0)
-            if size <= available_ram_gb * 0.8:
+            if model["size_gb"] <= available_ram_gb * 0.8:
                 result[tier].append(model)
 
     return result
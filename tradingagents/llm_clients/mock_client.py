@@ -1,6 +1,7 @@
 """Mock LLM client for integration testing without a real model."""
 
-from typing import Any, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, BaseMessage
@@ -141,7 +142,29 @@ The aggressive analyst makes a valid point about the strong trend, while the con
 FINAL TRANSACTION PROPOSAL: **BUY**"""
 
 
+_EXTRACT_CACHE_SIZE = 128
+_extract_cache: Dict[Tuple[str, ...], str] = {}
+
+
 def _extract_text(messages: List[BaseMessage]) -> str:
+    # Keyed on the message contents. Agents build their prompts afresh on each
+    # call, so a lookup still hashes and compares the full text; a hit only
+    # saves the walk over the message list and the join.
+    contents = tuple(getattr(m, "content", "") for m in messages)
+    if not all(isinstance(c, str) for c in contents):
+        return _join_content(messages)
+
+    text = _extract_cache.get(contents)
+    if text is None:
+        text = " ".join(contents)
+        if len(_extract_cache) >= _EXTRACT_CACHE_SIZE:
+            # FIFO eviction: dicts preserve insertion order
+            _extract_cache.pop(next(iter(_extract_cache)), None)
+        _extract_cache[contents] = text
+    return text
+
+
+def _join_content(messages: List[BaseMessage]) -> str:
     parts = []
     for m in messages:
         content = getattr(m, "content", "")
@@ -156,45 +179,45 @@ def _extract_text(messages: List[BaseMessage]) -> str:
     return " ".join(parts)
 
 
+# Routing table checked in priority order: the first entry whose keywords all
+# appear in the lowercased prompt wins. Plain substring probes are kept on
+# purpose; CPython's `in` beats a combined regex alternation on long prompts,
+# and a token-set prefilter (set(t.split())) costs as much as the whole chain
+# while losing phrase adjacency ("bull ... analyst") and tripping on
+# punctuation ("analyst's").
+_ROUTES: Tuple[Tuple[Tuple[str, ...], str], ...] = (
+    (("extract the investment decision",), "BUY"),
+    (("analyzing financial markets",), MOCK_MARKET_REPORT),
+    (("social media", "company specific news"), MOCK_SENTIMENT_REPORT),
+    (("news researcher", "recent news and trends"), MOCK_NEWS_REPORT),
+    (("fundamental information",), MOCK_FUNDAMENTALS_REPORT),
+    (("financial documents",), MOCK_FUNDAMENTALS_REPORT),
+    (("bull analyst",), MOCK_BULL_ARGUMENT),
+    (("bear analyst",), MOCK_BEAR_ARGUMENT),
+    (("portfolio manager and debate facilitator",), MOCK_RESEARCH_MANAGER_DECISION),
+    (("risk management judge",), MOCK_RISK_JUDGE_DECISION),
+    (("trading agent", "investment decision"), MOCK_TRADER_DECISION),
+    (("aggressive risk analyst",), MOCK_AGGRESSIVE_RISK),
+    (("conservative risk analyst",), MOCK_CONSERVATIVE_RISK),
+    (("neutral risk analyst",), MOCK_NEUTRAL_RISK),
+    (
+        ("expert financial analyst", "reviewing trading"),
+        "Reflection: The analysis was thorough and well-supported by data.",
+    ),
+)
+
+_DEFAULT_RESPONSE = "Analysis complete. FINAL TRANSACTION PROPOSAL: **BUY**"
+
+
+@lru_cache(maxsize=64)
 def _route_response(text: str) -> str:
+    # Agents resend the same multi-KB prompts on every run, so the keyword
+    # scan below is cached on the prompt text.
     t = text.lower()
-
-    if "extract the investment decision" in t:
-        return "BUY"
-
-    if "analyzing financial markets" in t:
-        return MOCK_MARKET_REPORT
-    if "social media" in t and "company specific news" in t:
-        return MOCK_SENTIMENT_REPORT
-    if "news researcher" in t and "recent news and trends" in t:
-        return MOCK_NEWS_REPORT
-    if "fundamental information" in t or "financial documents" in t:
-        return MOCK_FUNDAMENTALS_REPORT
-
-    if "bull analyst" in t:
-        return MOCK_BULL_ARGUMENT
-    if "bear analyst" in t:
-        return MOCK_BEAR_ARGUMENT
-
-    if "portfolio manager and debate facilitator" in t:
-        return MOCK_RESEARCH_MANAGER_DECISION
-    if "risk management judge" in t:
-        return MOCK_RISK_JUDGE_DECISION
-
-    if "trading agent" in t and "investment decision" in t:
-        return MOCK_TRADER_DECISION
-
-    if "aggressive risk analyst" in t:
-        return MOCK_AGGRESSIVE_RISK
-    if "conservative risk analyst" in t:
-        return MOCK_CONSERVATIVE_RISK
-    if "neutral risk analyst" in t:
-        return MOCK_NEUTRAL_RISK
-
-    if "expert financial analyst" in t and "reviewing trading" in t:
-        return "Reflection: The analysis was thorough and well-supported by data."
-
-    return "Analysis complete. FINAL TRANSACTION PROPOSAL: **BUY**"
+    for keywords, response in _ROUTES:
+        if all(k in t for k in keywords):
+            return response
+    return _DEFAULT_RESPONSE
 
 
 class MockChatModel(BaseChatModel):
@@ -222,9 +245,28 @@ class MockChatModel(BaseChatModel):
     ) -> ChatResult:
         prompt_text = _extract_text(messages)
         content = _route_response(prompt_text)
+        # The canned text is shared, but the message/result objects must be
+        # fresh per call: BaseChatModel stamps a run-specific id and
+        # response_metadata onto the returned message, and LangGraph's
+        # add_messages reducer de-duplicates messages by id.
         message = AIMessage(content=content)
         return ChatResult(generations=[ChatGeneration(message=message)])
 
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        """Native async path so ainvoke() skips the default thread-pool offload.
+
+        Only nodes that call llm.ainvoke reach this (currently the risk
+        debaters); sync agent nodes still go through _generate. Routing is pure
+        in-memory string work, so there is nothing to await.
+        """
+        return self._generate(messages, stop, run_manager, **kwargs)
+
 
 class MockLLMClient(BaseLLMClient):
     """Mock LLM client for integration testing."""